@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Cold start benchmark for the leaderboard CLI
+Runs the CLI in fresh interpreters, reports wall time and the slowest
+imports from `python -X importtime`, and fails if startup exceeds a target
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CLI = os.path.join(HERE, 'xml_to_html_parser.py')
+
+
+def time_cli_runs(input_file: str, runs: int) -> list:
+    """Time full CLI runs (start, parse, render, write) in fresh interpreters"""
+    timings = []
+    with tempfile.TemporaryDirectory() as tmp:
+        output = os.path.join(tmp, 'index.html')
+        for _ in range(runs):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, CLI, input_file, '-o', output],
+                           check=True, stdout=subprocess.DEVNULL)
+            timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def collect_import_times(input_file: str) -> list:
+    """Return (cumulative_us, self_us, module) for every import done by the CLI"""
+    with tempfile.TemporaryDirectory() as tmp:
+        output = os.path.join(tmp, 'index.html')
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', CLI, input_file, '-o', output],
+            check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+            text=True)
+
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        try:
+            self_us = int(fields[0])
+            cumulative_us = int(fields[1])
+        except ValueError:
+            # Header line
+            continue
+        imports.append((cumulative_us, self_us, fields[2].strip()))
+    return imports
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark leaderboard CLI cold start')
+    parser.add_argument('input_file', nargs='?', default=os.path.join(HERE, 'leaderboard.xml'),
+                       help='Input XML file path (default: leaderboard.xml)')
+    parser.add_argument('-n', '--runs', type=int, default=10,
+                       help='Number of timed runs (default: 10)')
+    parser.add_argument('-t', '--target-ms', type=float, default=150.0,
+                       help='Fail if median run time exceeds this (default: 150)')
+    parser.add_argument('--top', type=int, default=10,
+                       help='Number of slowest imports to show (default: 10)')
+
+    args = parser.parse_args()
+
+    imports = collect_import_times(args.input_file)
+    total_import_ms = sum(self_us for _, self_us, _ in imports) / 1000
+
+    print(f"📦 Slowest imports (cumulative):")
+    for cumulative_us, self_us, module in sorted(imports, reverse=True)[:args.top]:
+        print(f"   {cumulative_us / 1000:7.2f} ms  {module}")
+    print(f"   Total import time: {total_import_ms:.2f} ms ({len(imports)} modules)")
+
+    timings = time_cli_runs(args.input_file, args.runs)
+    median = statistics.median(timings)
+
+    print(f"\n⏱️  CLI cold start over {args.runs} runs:")
+    print(f"   min {min(timings):.2f} ms, median {median:.2f} ms, max {max(timings):.2f} ms")
+    print(f"   target {args.target_ms:.2f} ms")
+
+    if median > args.target_ms:
+        print(f"\n❌ Median cold start exceeds target by {median - args.target_ms:.2f} ms")
+        sys.exit(1)
+
+    print(f"\n✅ Cold start within target")
+
+
+if __name__ == '__main__':
+    main()
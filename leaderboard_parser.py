@@ -0,0 +1,301 @@
+"""
+Pomodoro Leaderboard XML to HTML Parser library
+Parses Excel XML format leaderboard data and renders it as an HTML page
+"""
+
+
+class PomodoroLeaderboardParser:
+    def __init__(self, xml_file: str):
+        self.xml_file = xml_file
+        self.dates = []
+        self.users_data = {}
+        self.mvp_data = {}
+        self.totals = {}
+        
+    def parse_xml(self) -> bool:
+        """Parse the Excel XML file and extract leaderboard data"""
+        # ElementTree pulls in re/enum; defer it until parsing is requested
+        import xml.etree.ElementTree as ET
+        
+        try:
+            tree = ET.parse(self.xml_file)
+            root = tree.getroot()
+            
+            # Define namespace
+            ns = {'ss': 'urn:schemas-microsoft-com:office:spreadsheet'}
+            
+            # Find the worksheet and table
+            worksheet = root.find('.//ss:Worksheet', ns)
+            if worksheet is None:
+                print("Error: Could not find worksheet in XML file")
+                return False
+                
+            table = worksheet.find('.//ss:Table', ns)
+            if table is None:
+                print("Error: Could not find table in worksheet")
+                return False
+            
+            rows = table.findall('ss:Row', ns)
+            if len(rows) < 2:
+                print("Error: Not enough data rows in table")
+                return False
+            
+            # Parse dates from first row
+            self._parse_dates(rows[0], ns)
+            
+            # Parse user data from subsequent rows
+            self._parse_user_data(rows[1:], ns)
+            
+            return True
+            
+        except ET.ParseError as e:
+            print(f"Error parsing XML file: {e}")
+            return False
+        except Exception as e:
+            print(f"Unexpected error: {e}")
+            return False
+    
+    def _parse_dates(self, row, ns):
+        """Extract dates from the header row"""
+        cells = row.findall('ss:Cell', ns)
+        for cell in cells:
+            data = cell.find('ss:Data', ns)
+            if data is not None and data.text:
+                # Check if it looks like a date (contains dots)
+                if '.' in data.text:
+                    self.dates.append(data.text.strip())
+    
+    def _parse_user_data(self, rows, ns):
+        """Extract user data from data rows"""
+        for i, row in enumerate(rows):
+            cells = row.findall('ss:Cell', ns)
+            if not cells:
+                continue
+                
+            # Get first cell data (username or label)
+            first_cell = cells[0].find('ss:Data', ns)
+            if first_cell is None or not first_cell.text:
+                continue
+                
+            first_text = first_cell.text.strip()
+            
+            # Skip empty rows
+            if not first_text:
+                continue
+            
+            # Only process user data rows (no more MVP row to handle)
+            if self._is_user_row(cells, ns):
+                self._parse_user_row(first_text, cells, ns)
+        
+        # After parsing all users, calculate MVP for each day
+        self._calculate_daily_mvp()
+    
+    def _calculate_daily_mvp(self):
+        """Calculate MVP (highest scorer) for each day"""
+        self.mvp_data = {}
+        
+        for day_idx in range(len(self.dates)):
+            max_score = -1
+            mvp_users = []
+            
+            # Find the highest score for this day
+            for username, scores in self.users_data.items():
+                if day_idx < len(scores):
+                    score = scores[day_idx]
+                    if score > max_score:
+                        max_score = score
+                        mvp_users = [username]
+                    elif score == max_score and score > 0:
+                        mvp_users.append(username)
+            
+            # Set MVP for this day (handle ties with "|")
+            if mvp_users and max_score > 0:
+                self.mvp_data[day_idx] = "|".join(mvp_users)
+            else:
+                self.mvp_data[day_idx] = "-"
+    
+    def _is_user_row(self, cells, ns) -> bool:
+        """Check if this row contains user score data"""
+        # Check if we have numeric-like data in subsequent cells
+        for cell in cells[1:]:
+            data = cell.find('ss:Data', ns)
+            if data is not None and data.text:
+                try:
+                    int(data.text)
+                    return True
+                except ValueError:
+                    continue
+        return False
+    
+    def _parse_user_row(self, username: str, cells, ns):
+        """Parse individual user data row"""
+        user_scores = []
+        
+        # Extract daily scores from cells (skip first cell which is username)
+        for i in range(len(self.dates)):
+            if i + 1 < len(cells):  # +1 because cell 0 is username
+                cell = cells[i + 1]
+                data = cell.find('ss:Data', ns)
+                if data is not None and data.text:
+                    try:
+                        score = int(data.text)
+                        user_scores.append(score)
+                    except ValueError:
+                        user_scores.append(0)
+                else:
+                    user_scores.append(0)
+            else:
+                user_scores.append(0)
+        
+        self.users_data[username] = user_scores
+        self.totals[username] = sum(user_scores)
+    
+    def generate_html(self, output_file: str = 'index.html'):
+        """Generate beautiful HTML page from parsed data"""
+        
+        # Sort users by total score
+        sorted_users = sorted(self.totals.items(), key=lambda x: x[1], reverse=True)
+        
+        # The static shell is only needed when a page is actually written
+        from leaderboard_template import HTML_HEAD, HTML_TAIL
+        
+        html_content = HTML_HEAD
+        
+        # Add summary section
+        html_content += self._generate_summary_section(sorted_users)
+        
+        # Add main leaderboard table
+        html_content += self._generate_leaderboard_table()
+        
+        # Add statistics
+        html_content += self._generate_statistics()
+        
+        html_content += HTML_TAIL
+        
+        # Write to file
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(html_content)
+        
+        print(f"HTML leaderboard generated successfully: {output_file}")
+    
+    def _generate_summary_section(self, sorted_users):
+        """Generate the summary/podium section"""
+        html = """
+            <div class="summary">
+                <h2>🏆 Current Rankings</h2>
+                <div class="podium">
+        """
+        
+        podium_classes = ['first', 'second', 'third']
+        ranks = ['🥇', '🥈', '🥉']
+        
+        for i, (username, total) in enumerate(sorted_users[:3]):
+            class_name = podium_classes[i] if i < 3 else ''
+            rank_emoji = ranks[i] if i < 3 else f"#{i+1}"
+            
+            html += f"""
+                    <div class="podium-place {class_name}">
+                        <div class="podium-rank">{rank_emoji}</div>
+                        <div class="podium-name">{username}</div>
+                        <div class="podium-score">{total} 🍅</div>
+                    </div>
+            """
+        
+        html += """
+                </div>
+            </div>
+        """
+        
+        return html
+    
+    def _generate_leaderboard_table(self):
+        """Generate the main leaderboard table"""
+        html = """
+            <div class="leaderboard-table">
+                <div class="table-header">📊 Daily Tracking</div>
+                <div class="table-container">
+                    <table>
+                        <thead>
+                            <tr>
+                                <th class="user-name">User</th>
+                                <th class="total-column">Total 🍅</th>
+        """
+        
+        # Add date headers in reverse order (most recent first)
+        for date in reversed(self.dates):
+            html += f'<th>{date}</th>'
+        
+        html += '</tr></thead><tbody>'
+        
+        # Sort users by total score for ranking
+        sorted_users = sorted(self.totals.items(), key=lambda x: x[1], reverse=True)
+        
+        # Add user rows
+        for rank, (username, total) in enumerate(sorted_users, 1):
+            rank_class = f'rank-{rank}' if rank <= 3 else ''
+            html += f'<tr><td class="user-name {rank_class}">#{rank} {username}</td>'
+            html += f'<td class="total-column">{total}</td>'
+            
+            user_scores = self.users_data.get(username, [])
+            max_score = max(user_scores) if user_scores else 0
+            
+            # Display scores in reverse order (most recent first)
+            for i in reversed(range(len(user_scores))):
+                score = user_scores[i]
+                score_class = 'score-cell'
+                if score > 0:
+                    if max_score > 0:
+                        if score >= max_score * 0.8:
+                            score_class += ' score-high'
+                        elif score >= max_score * 0.4:
+                            score_class += ' score-medium'
+                        else:
+                            score_class += ' score-low'
+                
+                html += f'<td class="{score_class}">{score}</td>'
+            
+            html += '</tr>'
+        
+        # Add MVP row
+        html += '<tr class="mvp-row"><td class="user-name"><strong>👑 MVP</strong></td>'
+        html += '<td class="mvp-cell">-</td>'
+        # Display MVP data in reverse order (most recent first)
+        for i in reversed(range(len(self.dates))):
+            mvp = self.mvp_data.get(i, '')
+            html += f'<td class="mvp-cell">{mvp}</td>'
+        html += '</tr>'
+        
+        html += '</tbody></table></div></div>'
+        
+        return html
+    
+    def _generate_statistics(self):
+        """Generate statistics section"""
+        total_pomodoros = sum(self.totals.values())
+        active_days = len([d for d in self.dates if d])
+        avg_per_day = round(total_pomodoros / active_days, 1) if active_days > 0 else 0
+        top_performer = max(self.totals.items(), key=lambda x: x[1])[0] if self.totals else "N/A"
+        
+        html = f"""
+            <div class="stats">
+                <div class="stat-card">
+                    <div class="stat-value">{total_pomodoros}</div>
+                    <div class="stat-label">Total Pomodoros</div>
+                </div>
+                <div class="stat-card">
+                    <div class="stat-value">{active_days}</div>
+                    <div class="stat-label">Tracking Days</div>
+                </div>
+                <div class="stat-card">
+                    <div class="stat-value">{avg_per_day}</div>
+                    <div class="stat-label">Avg per Day</div>
+                </div>
+                <div class="stat-card">
+                    <div class="stat-value">👑</div>
+                    <div class="stat-label">Leader: {top_performer}</div>
+                </div>
+            </div>
+        """
+        
+        return html
+